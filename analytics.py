@@ -8,16 +8,46 @@ from __future__ import annotations
 
 import calendar
 import csv
+import functools
+import heapq
 import json
 import logging
+import operator
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Any
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Any, NotRequired, TypedDict
 
 logger = logging.getLogger(__name__)
 
 
+class DailyRecord(TypedDict):
+    """Per-day aggregate record produced by ``process_conversations``.
+
+    Records stay plain dicts so they serialize directly to the JSON/CSV
+    outputs and the dashboard payload; this type documents the keys the
+    aggregators read.  Content metric fields are optional because the
+    usage aggregators (chart, monthly, weekly, comparison) do not need them.
+    """
+
+    date: str
+    total_messages: int
+    total_chats: int
+    avg_messages_per_chat: float
+    max_messages_in_chat: int
+    user_words: NotRequired[int]
+    user_chars: NotRequired[int]
+    user_msgs: NotRequired[int]
+    user_code_msgs: NotRequired[int]
+    asst_words: NotRequired[int]
+    asst_chars: NotRequired[int]
+    asst_msgs: NotRequired[int]
+    asst_code_msgs: NotRequired[int]
+
+
 def load_conversations(path: str = "conversations.json") -> list[dict]:
     """Load conversations from an OpenAI export JSON file.
 
@@ -37,6 +67,9 @@ def load_conversations(path: str = "conversations.json") -> list[dict]:
         return json.load(f)
 
 
+_CODE_FENCE_LANG_RE = re.compile(r"```(\w+)")
+
+
 def _extract_message_content(message: dict) -> tuple[str, int, int, bool, list[str]]:
     """Extract text content and metrics from a single message.
 
@@ -55,8 +88,8 @@ def _extract_message_content(message: dict) -> tuple[str, int, int, bool, list[s
 
     word_count = len(text.split()) if text.strip() else 0
     char_count = len(text)
-    has_code = bool(re.search(r"```", text))
-    code_languages = re.findall(r"```(\w+)", text) if has_code else []
+    has_code = "```" in text
+    code_languages = _CODE_FENCE_LANG_RE.findall(text) if has_code else []
     return text, word_count, char_count, has_code, code_languages
 
 
@@ -81,7 +114,7 @@ def _init_daily_bucket() -> dict:
     }
 
 
-def _build_daily_records(daily_stats: dict) -> list[dict]:
+def _build_daily_records(daily_stats: dict) -> list[DailyRecord]:
     """Convert accumulated daily stats into final daily record dicts.
 
     Args:
@@ -90,7 +123,7 @@ def _build_daily_records(daily_stats: dict) -> list[dict]:
     Returns:
         List of per-day record dicts with computed averages and maximums.
     """
-    daily_records = []
+    daily_records: list[DailyRecord] = []
     for date, stats in daily_stats.items():
         mpc = stats["messages_per_chat"]
         avg_mpc = sum(mpc) / len(mpc) if mpc else 0
@@ -139,16 +172,16 @@ def _extract_conversation_messages(
 
     results: list[tuple[str, float | None, int, int, bool, list[str]]] = []
     for message_data in mapping.values():
-        message = message_data.get("message") if isinstance(message_data, dict) else None
-        if message is None:
+        if not isinstance(message_data, dict):
+            continue
+        message = message_data.get("message")
+        if not isinstance(message, dict):
             continue
-
         author = message.get("author")
-        if author is None or not isinstance(author, dict):
+        if not isinstance(author, dict):
             continue
-
         role = author.get("role")
-        if role not in ("user", "assistant"):
+        if role != "user" and role != "assistant":
             continue
 
         create_time = message.get("create_time")
@@ -203,14 +236,15 @@ def _accumulate_user_daily_stats(
         char_count: Number of characters in the message.
         has_code: Whether the message contains a code block.
     """
-    if message_date not in daily_stats:
-        daily_stats[message_date] = _init_daily_bucket()
-    daily_stats[message_date]["total_messages"] += 1
-    daily_stats[message_date]["user_words"] += word_count
-    daily_stats[message_date]["user_chars"] += char_count
-    daily_stats[message_date]["user_msgs"] += 1
+    bucket = daily_stats.get(message_date)
+    if bucket is None:
+        bucket = daily_stats[message_date] = _init_daily_bucket()
+    bucket["total_messages"] += 1
+    bucket["user_words"] += word_count
+    bucket["user_chars"] += char_count
+    bucket["user_msgs"] += 1
     if has_code:
-        daily_stats[message_date]["user_code_msgs"] += 1
+        bucket["user_code_msgs"] += 1
 
 
 def _accumulate_asst_daily_stats(
@@ -232,13 +266,14 @@ def _accumulate_asst_daily_stats(
         char_count: Number of characters in the message.
         has_code: Whether the message contains a code block.
     """
-    if asst_date not in daily_stats:
+    bucket = daily_stats.get(asst_date)
+    if bucket is None:
         return
-    daily_stats[asst_date]["asst_words"] += word_count
-    daily_stats[asst_date]["asst_chars"] += char_count
-    daily_stats[asst_date]["asst_msgs"] += 1
+    bucket["asst_words"] += word_count
+    bucket["asst_chars"] += char_count
+    bucket["asst_msgs"] += 1
     if has_code:
-        daily_stats[asst_date]["asst_code_msgs"] += 1
+        bucket["asst_code_msgs"] += 1
 
 
 def _process_chat_messages(
@@ -267,6 +302,7 @@ def _process_chat_messages(
     chat_message_count = 0
     chat_start_time: datetime | None = None
     chat_end_time: datetime | None = None
+    chat_start_date: date | None = None
     chat_user_words = 0
     chat_asst_words = 0
     chat_code_langs: set[str] = set()
@@ -279,26 +315,31 @@ def _process_chat_messages(
                 message_datetime = datetime.fromtimestamp(float(create_time))
             except (TypeError, ValueError, OSError, OverflowError):
                 continue
+            message_date = message_datetime.date()
             chat_message_count += 1
             chat_user_words += word_count
             all_timestamps.append(message_datetime)
             chat_start_time, chat_end_time = _update_time_range(
                 chat_start_time, chat_end_time, message_datetime,
             )
+            # Derive the chat's start date only when the start time moves,
+            # rather than allocating a date for every assistant reply.
+            if chat_start_time is message_datetime:
+                chat_start_date = message_date
             _accumulate_user_daily_stats(
-                daily_stats, message_datetime.date(), word_count, char_count, has_code,
+                daily_stats, message_date, word_count, char_count, has_code,
             )
         elif role == "assistant":
             chat_asst_words += word_count
-            if chat_start_time is not None:
+            if chat_start_date is not None:
                 _accumulate_asst_daily_stats(
-                    daily_stats, chat_start_time.date(), word_count, char_count, has_code,
+                    daily_stats, chat_start_date, word_count, char_count, has_code,
                 )
 
     if chat_message_count == 0:
         return None
 
-    chat_date = chat_start_time.date()
+    chat_date = chat_start_date
     chat_duration = (chat_end_time - chat_start_time).total_seconds() / 60
     response_ratio = (
         round(chat_asst_words / chat_user_words, 2)
@@ -306,13 +347,19 @@ def _process_chat_messages(
         else 0.0
     )
 
-    daily_stats[chat_date]["total_chats"] += 1
-    daily_stats[chat_date]["messages_per_chat"].append(chat_message_count)
+    day_bucket = daily_stats[chat_date]
+    day_bucket["total_chats"] += 1
+    day_bucket["messages_per_chat"].append(chat_message_count)
+
+    # The date string is the prefix of the start timestamp, and
+    # single-message chats share one timestamp for start and end.
+    start_iso = chat_start_time.isoformat()
+    end_iso = start_iso if chat_end_time is chat_start_time else chat_end_time.isoformat()
 
     return {
-        "date": chat_date.isoformat(),
-        "start_time": chat_start_time.isoformat(),
-        "end_time": chat_end_time.isoformat(),
+        "date": start_iso[:10],
+        "start_time": start_iso,
+        "end_time": end_iso,
         "message_count": chat_message_count,
         "duration_minutes": round(chat_duration, 2),
         "user_words": chat_user_words,
@@ -323,8 +370,8 @@ def _process_chat_messages(
 
 
 def process_conversations(
-    conversations: list[dict],
-) -> tuple[list[dict], list[dict], list[datetime]]:
+    conversations: Iterable[dict],
+) -> tuple[list[dict], list[DailyRecord], list[datetime]]:
     """Parse raw conversations into chat summaries, daily records, and timestamps.
 
     Iterates through every conversation's message mapping, extracting user
@@ -333,7 +380,9 @@ def process_conversations(
     (total messages, chats, content metrics).
 
     Args:
-        conversations: List of raw conversation dicts from ``load_conversations``.
+        conversations: Raw conversation dicts, e.g. the list returned by
+            ``load_conversations``.  Any iterable is accepted and consumed
+            once, so a generator can feed conversations incrementally.
             Each dict must contain a "mapping" key whose values hold messages.
 
     Returns:
@@ -351,7 +400,9 @@ def process_conversations(
     daily_stats: dict = {}
     all_message_timestamps: list[datetime] = []
 
+    num_conversations = 0
     for chat in conversations:
+        num_conversations += 1
         messages = _extract_conversation_messages(chat)
         if not messages:
             continue
@@ -359,11 +410,11 @@ def process_conversations(
         if summary is not None:
             chat_summaries.append(summary)
 
-    if conversations and not chat_summaries:
+    if num_conversations and not chat_summaries:
         logger.warning(
             "Loaded %d conversations but none produced valid summaries. "
             "The OpenAI export format may have changed.",
-            len(conversations),
+            num_conversations,
         )
 
     return chat_summaries, _build_daily_records(daily_stats), all_message_timestamps
@@ -404,40 +455,44 @@ def compute_gap_analysis(
         }
 
     sorted_ts = sorted(timestamps)
-
-    gaps = []
-    for i in range(1, len(sorted_ts)):
-        diff = sorted_ts[i] - sorted_ts[i - 1]
-        gap_days = diff.total_seconds() / 86400
+    # Format each timestamp once; every interior timestamp is both the end
+    # of one gap and the start of the next.
+    iso = [ts.isoformat() for ts in sorted_ts]
+
+    gap_lengths: list[float] = []
+    gap_starts: list[int] = []
+    for i, (prev, cur) in enumerate(zip(sorted_ts, sorted_ts[1:])):
+        gap_days = (cur - prev).total_seconds() / 86400
         if gap_days > 0:
-            gaps.append(
-                {
-                    "start_timestamp": sorted_ts[i - 1].isoformat(),
-                    "end_timestamp": sorted_ts[i].isoformat(),
-                    "length_days": gap_days,
-                }
-            )
-
-    gaps.sort(key=lambda g: g["length_days"], reverse=True)
+            gap_lengths.append(gap_days)
+            gap_starts.append(i)
+
+    # Rank positions by length with a C-level key (stable, so equal gaps
+    # stay chronological), then build each gap dict once in final order.
+    order = sorted(range(len(gap_lengths)), key=gap_lengths.__getitem__, reverse=True)
+    gaps = [
+        {
+            "start_timestamp": iso[gap_starts[k]],
+            "end_timestamp": iso[gap_starts[k] + 1],
+            "length_days": gap_lengths[k],
+        }
+        for k in order
+    ]
 
-    dates_with_messages = set(ts.date() for ts in sorted_ts)
+    # Every active date lies within [start_date, end_date], so inactive
+    # days follow directly from the count of distinct active dates.
+    days_active = len(set(map(datetime.date, sorted_ts)))
     start_date = sorted_ts[0].date()
     end_date = sorted_ts[-1].date()
     total_days = (end_date - start_date).days + 1
-
-    days_inactive = 0
-    current = start_date
-    while current <= end_date:
-        if current not in dates_with_messages:
-            days_inactive += 1
-        current += timedelta(days=1)
+    days_inactive = total_days - days_active
 
     proportion_inactive = (days_inactive / total_days * 100) if total_days > 0 else 0.0
 
     return {
         "gaps": gaps,
         "total_days": total_days,
-        "days_active": len(dates_with_messages),
+        "days_active": days_active,
         "days_inactive": days_inactive,
         "proportion_inactive": round(proportion_inactive, 2),
         "longest_gap": gaps[0] if gaps else None,
@@ -553,7 +608,7 @@ def compute_activity_by_year(timestamps: list[datetime]) -> list[dict]:
 
 
 def compute_summary_stats(
-    summaries: list[dict], records: list[dict]
+    summaries: list[dict], records: list[DailyRecord]
 ) -> dict[str, Any]:
     """Compute high-level summary statistics.
 
@@ -585,17 +640,14 @@ def compute_summary_stats(
         last_date = max(dates).strftime("%Y-%m-%d")
         years_span = round((max(dates) - min(dates)).days / 365.25, 2)
 
-    sorted_by_chats = sorted(records, key=lambda r: r["total_chats"], reverse=True)
-    sorted_by_messages = sorted(records, key=lambda r: r["total_messages"], reverse=True)
-
     return {
         "total_messages": total_messages,
         "total_chats": total_chats,
         "first_date": first_date,
         "last_date": last_date,
         "years_span": years_span,
-        "top_days_by_chats": _top_records_per_year(sorted_by_chats),
-        "top_days_by_messages": _top_records_per_year(sorted_by_messages),
+        "top_days_by_chats": _top_records_per_year(records, "total_chats"),
+        "top_days_by_messages": _top_records_per_year(records, "total_messages"),
     }
 
 
@@ -616,12 +668,24 @@ def _rolling_avg(values: list[float], window: int) -> list[float]:
         List of floats the same length as *values*, where each element
         is the mean of the trailing *window* (or fewer) values.
     """
-    result = []
-    for i in range(len(values)):
-        start = max(0, i - window + 1)
-        w = values[start : i + 1]
-        result.append(sum(w) / len(w))
-    return result
+    if window >= len(values):
+        # The window never fills, so every element is the running mean.
+        return _expanding_avg(values)
+    if not all(map(float.is_integer, map(float, values))):
+        # Summing each window directly keeps every mean independent of the
+        # values before it; differencing float prefix sums would carry
+        # rounding error forward and can flip the displayed 2dp value.
+        return [
+            sum(values[max(0, i - window + 1) : i + 1]) / min(i + 1, window)
+            for i in range(len(values))
+        ]
+    # Integer-valued series (chat and message counts): float sums of
+    # integers are exact, so each full-window sum is the difference of two
+    # prefix sums built in C by accumulate, and the series costs O(n).
+    cs = list(accumulate(values, initial=0.0))
+    head = [cs[i] / i for i in range(1, window + 1)]
+    tail = [d / window for d in map(operator.sub, cs[window + 1 :], cs[1:-window])]
+    return head + tail
 
 
 def _expanding_avg(values: list[float]) -> list[float]:
@@ -634,12 +698,7 @@ def _expanding_avg(values: list[float]) -> list[float]:
         List of floats the same length as *values*, where element *i* is
         the mean of values[0] through values[i] (inclusive).
     """
-    result: list[float] = []
-    s = 0.0
-    for i, v in enumerate(values, 1):
-        s += v
-        result.append(s / i)
-    return result
+    return [s / i for i, s in enumerate(accumulate(values), 1)]
 
 
 def _format_rolling(values: list[float], window: int) -> list[float]:
@@ -687,7 +746,7 @@ def _build_chart_series(values: list[float]) -> dict[str, list[float]]:
     }
 
 
-def compute_chart_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_chart_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Compute chart series from daily records for Chart.js rendering.
 
     Sorts records by date and produces raw values plus 7-day, 28-day, and
@@ -703,11 +762,13 @@ def compute_chart_data(daily_records: list[dict]) -> dict[str, Any]:
         metric (chats, avg_messages, total_messages) a sub-dict with
         keys: values, avg_7d, avg_28d, avg_lifetime.
     """
-    sorted_records = sorted(daily_records, key=lambda r: r["date"])
-    dates = [r["date"] for r in sorted_records]
-    chats = [r["total_chats"] for r in sorted_records]
-    avg_msgs = [r["avg_messages_per_chat"] for r in sorted_records]
-    total_msgs = [r["total_messages"] for r in sorted_records]
+    sorted_records = sorted(daily_records, key=operator.itemgetter("date"))
+    # Transpose rows into columns in one pass instead of four comprehensions.
+    row_fields = operator.itemgetter(
+        "date", "total_chats", "avg_messages_per_chat", "total_messages",
+    )
+    columns = [list(col) for col in zip(*map(row_fields, sorted_records))]
+    dates, chats, avg_msgs, total_msgs = columns or ([], [], [], [])
     return {
         "dates": dates,
         "chats": _build_chart_series(chats),
@@ -716,34 +777,36 @@ def compute_chart_data(daily_records: list[dict]) -> dict[str, Any]:
     }
 
 
-def _build_monthly_buckets(sorted_records: list[dict]) -> dict[str, dict]:
-    """Aggregate sorted daily records into monthly buckets.
+def _build_monthly_buckets(daily_records: list[DailyRecord]) -> dict[str, dict]:
+    """Aggregate daily records into monthly buckets in a single pass.
 
     Groups records by their "YYYY-MM" month key and sums chats,
-    messages, and raw totals for avg-message computation.
+    messages, and raw totals for avg-message computation.  Input order
+    does not matter; callers sort the (much smaller) set of month keys.
 
     Args:
-        sorted_records: List of daily record dicts, already sorted by
-            date.  Each must contain "date", "total_chats", and
-            "total_messages".
+        daily_records: List of daily record dicts.  Each must contain
+            "date", "total_chats", and "total_messages".
 
     Returns:
         Dict mapping "YYYY-MM" month keys to bucket dicts with keys
         chats, messages, total_msgs_raw, total_chats_raw.
     """
-    monthly: dict[str, dict] = {}
-    for r in sorted_records:
+    sums: dict[str, list[int]] = {}
+    for r in daily_records:
         month = r["date"][:7]
-        if month not in monthly:
-            monthly[month] = {"chats": 0, "messages": 0, "total_msgs_raw": 0, "total_chats_raw": 0}
-        monthly[month]["chats"] += r["total_chats"]
-        monthly[month]["messages"] += r["total_messages"]
-        monthly[month]["total_msgs_raw"] += r["total_messages"]
-        monthly[month]["total_chats_raw"] += r["total_chats"]
-    return monthly
+        acc = sums.get(month)
+        if acc is None:
+            acc = sums[month] = [0, 0]
+        acc[0] += r["total_chats"]
+        acc[1] += r["total_messages"]
+    return {
+        month: {"chats": c, "messages": m, "total_msgs_raw": m, "total_chats_raw": c}
+        for month, (c, m) in sums.items()
+    }
 
 
-def compute_monthly_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_monthly_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Aggregate daily records into monthly buckets for the overview chart.
 
     Args:
@@ -756,8 +819,7 @@ def compute_monthly_data(daily_records: list[dict]) -> dict[str, Any]:
         chats_avg_3m (3-month rolling average of chats), messages_avg_3m
         (3-month rolling average of messages).
     """
-    sorted_records = sorted(daily_records, key=lambda r: r["date"])
-    monthly = _build_monthly_buckets(sorted_records)
+    monthly = _build_monthly_buckets(daily_records)
 
     months = sorted(monthly.keys())
     chats = [monthly[m]["chats"] for m in months]
@@ -778,42 +840,60 @@ def compute_monthly_data(daily_records: list[dict]) -> dict[str, Any]:
     }
 
 
-def _build_weekly_buckets(sorted_records: list[dict]) -> dict[str, dict]:
-    """Aggregate sorted daily records into ISO-week buckets.
+@functools.lru_cache(maxsize=16384)
+def _iso_week_of(date_str: str) -> tuple[str, str]:
+    """Return the ISO week key and Monday date for an ISO date string.
+
+    Memoized because both weekly aggregators parse the same daily record
+    dates on every dashboard build.
+
+    Args:
+        date_str: Date in "YYYY-MM-DD" form.
+
+    Returns:
+        A (week_key, monday) tuple, e.g. ("2024-W03", "2024-01-15").
+    """
+    from datetime import date as date_type
+
+    d = date_type.fromisoformat(date_str)
+    iso_year, iso_week, iso_weekday = d.isocalendar()
+    monday = d - timedelta(days=iso_weekday - 1)
+    return f"{iso_year}-W{iso_week:02d}", monday.isoformat()
+
+
+def _build_weekly_buckets(daily_records: list[DailyRecord]) -> dict[str, dict]:
+    """Aggregate daily records into ISO-week buckets in a single pass.
 
     Groups records by ISO week key and sums chats, messages, and raw
-    totals for avg-message computation.
+    totals for avg-message computation.  Input order does not matter;
+    callers sort the (much smaller) set of week keys.
 
     Args:
-        sorted_records: List of daily record dicts, already sorted by
-            date.  Each must contain "date", "total_chats", and
-            "total_messages".
+        daily_records: List of daily record dicts.  Each must contain
+            "date", "total_chats", and "total_messages".
 
     Returns:
         Dict mapping ISO week keys ("YYYY-Www") to bucket dicts with
         keys monday (isoformat string), chats, messages, total_msgs,
         total_chats.
     """
-    from datetime import date as date_type
-
     weekly: dict[str, dict] = {}
-    for r in sorted_records:
-        d = date_type.fromisoformat(r["date"])
-        iso = d.isocalendar()
-        week_key = f"{iso[0]}-W{iso[1]:02d}"
-        monday = d - timedelta(days=d.weekday())
-        if week_key not in weekly:
-            weekly[week_key] = {
-                "monday": monday.isoformat(),
+    for r in daily_records:
+        week_key, monday = _iso_week_of(r["date"])
+        bucket = weekly.get(week_key)
+        if bucket is None:
+            bucket = weekly[week_key] = {
+                "monday": monday,
                 "chats": 0,
                 "messages": 0,
                 "total_msgs": 0,
                 "total_chats": 0,
             }
-        weekly[week_key]["chats"] += r["total_chats"]
-        weekly[week_key]["messages"] += r["total_messages"]
-        weekly[week_key]["total_msgs"] += r["total_messages"]
-        weekly[week_key]["total_chats"] += r["total_chats"]
+        bucket["chats"] += r["total_chats"]
+        bucket["messages"] += r["total_messages"]
+    for bucket in weekly.values():
+        bucket["total_msgs"] = bucket["messages"]
+        bucket["total_chats"] = bucket["chats"]
     return weekly
 
 
@@ -846,7 +926,7 @@ def _weekly_series_from_buckets(
     return weeks, chats, messages, avg_messages
 
 
-def compute_weekly_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_weekly_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Aggregate daily records into ISO-week buckets for the trends page.
 
     Args:
@@ -859,8 +939,7 @@ def compute_weekly_data(daily_records: list[dict]) -> dict[str, Any]:
         chats_avg_4w, chats_avg_12w, messages_avg_4w, messages_avg_12w,
         avg_messages_avg_4w, avg_messages_avg_12w.
     """
-    sorted_records = sorted(daily_records, key=lambda r: r["date"])
-    weekly = _build_weekly_buckets(sorted_records)
+    weekly = _build_weekly_buckets(daily_records)
     weeks, chats, messages, avg_messages = _weekly_series_from_buckets(weekly)
 
     return {
@@ -975,7 +1054,7 @@ def _wrap_with_rolling(values: list[float]) -> dict[str, list[float]]:
     }
 
 
-def compute_content_chart_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_content_chart_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Compute daily content metrics (word counts, response ratio, code %) with rolling averages.
 
     Args:
@@ -1001,7 +1080,7 @@ def compute_content_chart_data(daily_records: list[dict]) -> dict[str, Any]:
     }
 
 
-def compute_content_weekly_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_content_weekly_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Aggregate content metrics by ISO week.
 
     Args:
@@ -1014,18 +1093,13 @@ def compute_content_weekly_data(daily_records: list[dict]) -> dict[str, Any]:
         response_ratio, code_pct_user, code_pct_asst) a sub-dict with
         values, avg_7d, and avg_28d.
     """
-    from datetime import date as date_type
-
     sorted_records = sorted(daily_records, key=lambda r: r["date"])
     weekly: dict[str, dict] = {}
     for r in sorted_records:
-        d = date_type.fromisoformat(r["date"])
-        iso = d.isocalendar()
-        week_key = f"{iso[0]}-W{iso[1]:02d}"
-        monday = d - timedelta(days=d.weekday())
+        week_key, monday = _iso_week_of(r["date"])
         if week_key not in weekly:
             weekly[week_key] = {
-                "monday": monday.isoformat(),
+                "monday": monday,
                 "user_words": 0, "user_chars": 0, "user_msgs": 0, "user_code_msgs": 0,
                 "asst_words": 0, "asst_chars": 0, "asst_msgs": 0, "asst_code_msgs": 0,
             }
@@ -1048,7 +1122,7 @@ def compute_content_weekly_data(daily_records: list[dict]) -> dict[str, Any]:
     }
 
 
-def compute_content_monthly_data(daily_records: list[dict]) -> dict[str, Any]:
+def compute_content_monthly_data(daily_records: list[DailyRecord]) -> dict[str, Any]:
     """Aggregate content metrics by calendar month.
 
     Args:
@@ -1107,22 +1181,19 @@ def compute_code_stats(chat_summaries: list[dict]) -> dict[str, Any]:
             - language_counts: list of dicts (language, count), sorted
               descending by count.
     """
-    lang_counter: dict[str, int] = {}
+    lang_counter: Counter[str] = Counter()
     convos_with_code = 0
     for s in chat_summaries:
         langs = s.get("code_languages", [])
         if langs:
             convos_with_code += 1
-            for lang in langs:
-                lang_counter[lang] = lang_counter.get(lang, 0) + 1
+            lang_counter.update(langs)
 
     total = len(chat_summaries)
     pct_with_code = round(convos_with_code / total * 100, 1) if total else 0.0
-    language_counts = sorted(
-        [{"language": lang, "count": cnt} for lang, cnt in lang_counter.items()],
-        key=lambda x: x["count"],
-        reverse=True,
-    )
+    language_counts = [
+        {"language": lang, "count": cnt} for lang, cnt in lang_counter.most_common()
+    ]
 
     return {
         "total_conversations_with_code": convos_with_code,
@@ -1170,7 +1241,7 @@ def compute_length_distribution(summaries: list[dict]) -> dict[str, Any]:
 
 
 def _compute_period_bucket(
-    daily_records: list[dict],
+    daily_records: list[DailyRecord],
     match_fn: object,
 ) -> dict[str, int | float]:
     """Aggregate daily records matching a predicate into a period bucket.
@@ -1223,7 +1294,7 @@ def _add_period_projections(
 
 
 def compute_period_comparison(
-    daily_records: list[dict],
+    daily_records: list[DailyRecord],
     reference_date: str | None = None,
 ) -> dict[str, Any]:
     """Compute month-over-month and year-over-year comparison stats.
@@ -1274,32 +1345,39 @@ def compute_period_comparison(
     return result
 
 
-def _top_records_per_year(records: list[dict], per_year: int = 10) -> list[dict]:
-    """Return top *per_year* records for each calendar year, preserving sort order.
+def _top_records_per_year(
+    records: list[DailyRecord], field: str, per_year: int = 10,
+) -> list[DailyRecord]:
+    """Return the top *per_year* records by *field* for each calendar year.
 
-    Records are already sorted by the desired ranking field (descending).
-    Collects up to *per_year* per year, then returns the merged list
-    in the original sort order.
+    Uses ``heapq.nlargest`` per year (O(N log K)) instead of sorting every
+    record.  The merged result is ordered descending by *field*; ties keep
+    their input order, matching a stable ``sorted(..., reverse=True)``.
 
     Args:
-        records: Pre-sorted (descending by ranking metric) list of daily
-            record dicts.  Each must contain a "date" key starting with
-            a 4-digit year.
+        records: List of daily record dicts in any order.  Each must
+            contain *field* and a "date" key starting with a 4-digit year.
+        field: Name of the numeric ranking field (e.g. "total_chats").
         per_year: Maximum number of records to keep per calendar year.
 
     Returns:
-        Filtered list of record dicts, containing at most *per_year*
-        entries per year, in the same order as the input.
+        List of record dicts, containing at most *per_year* entries per
+        year, sorted descending by *field*.
     """
-    buckets: dict[str, int] = {}
-    result = []
-    for r in records:
-        yr = r["date"][:4]
-        count = buckets.get(yr, 0)
-        if count < per_year:
-            result.append(r)
-            buckets[yr] = count + 1
-    return result
+    by_year: dict[str, list[int]] = {}
+    for i, r in enumerate(records):
+        by_year.setdefault(r["date"][:4], []).append(i)
+
+    def rank(i: int) -> Any:
+        return records[i][field]
+
+    selected = [
+        i for indices in by_year.values()
+        for i in heapq.nlargest(per_year, indices, key=rank)
+    ]
+    selected.sort()
+    selected.sort(key=rank, reverse=True)
+    return [records[i] for i in selected]
 
 
 def _top_gaps_per_year(gaps: list[dict], per_year: int = 25) -> list[dict]:
@@ -1337,6 +1415,13 @@ def build_dashboard_payload(path: str = "conversations.json") -> dict[str, Any]:
     computation needed by the web dashboard.  This is the only function
     the FastAPI app needs to call.
 
+    The file-derived sections are memoized on the file's path,
+    modification time, and size, so repeated calls against an unchanged
+    export skip loading and aggregation.  generated_at and comparison
+    depend on the current date and are recomputed on every call.  The
+    nested section dicts are shared between calls, so callers must treat
+    them as read-only.
+
     Args:
         path: Filesystem path to the OpenAI conversations.json export.
             Defaults to "conversations.json" in the current directory.
@@ -1352,8 +1437,41 @@ def build_dashboard_payload(path: str = "conversations.json") -> dict[str, Any]:
         FileNotFoundError: If the conversations file does not exist.
         json.JSONDecodeError: If the file contains invalid JSON.
     """
+    st = os.stat(path)
+    records, sections = _build_dashboard_sections_cached(
+        path, st.st_mtime_ns, st.st_size,
+    )
+    return {
+        "generated_at": datetime.now().isoformat(),
+        **sections,
+        "comparison": compute_period_comparison(records),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _build_dashboard_sections_cached(
+    path: str, mtime_ns: int, size: int,
+) -> tuple[list[DailyRecord], dict[str, Any]]:
+    """Build the date-independent dashboard sections for one export file.
+
+    Memoized by ``build_dashboard_payload``; everything returned here
+    depends only on the file contents, never on the current date.
+
+    Args:
+        path: Filesystem path to the OpenAI conversations.json export.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Tuple of (daily records, payload sections), where the sections are
+        every ``build_dashboard_payload`` key except generated_at and
+        comparison.
+    """
     convos = load_conversations(path)
     summaries, records, timestamps = process_conversations(convos)
+    # Drop the raw export (often several times the size of the derived
+    # data) before the aggregation passes to lower peak memory.
+    del convos
     gap_data = compute_gap_analysis(timestamps)
     stats = compute_summary_stats(summaries, records)
     charts = compute_chart_data(records)
@@ -1370,8 +1488,7 @@ def build_dashboard_payload(path: str = "conversations.json") -> dict[str, Any]:
         "pct_conversations_with_code": code_stats["pct_with_code"],
     }
 
-    return {
-        "generated_at": datetime.now().isoformat(),
+    return records, {
         "summary": stats,
         "charts": charts,
         "gaps": _top_gaps_per_year(gap_data["gaps"], per_year=25),
@@ -1386,7 +1503,6 @@ def build_dashboard_payload(path: str = "conversations.json") -> dict[str, Any]:
         "weekly": compute_weekly_data(records),
         "hourly": compute_hourly_data(timestamps),
         "length_distribution": compute_length_distribution(summaries),
-        "comparison": compute_period_comparison(records),
         "activity_by_year": compute_activity_by_year(timestamps),
         "content_charts": compute_content_chart_data(records),
         "content_weekly": compute_content_weekly_data(records),
@@ -1400,9 +1516,46 @@ def build_dashboard_payload(path: str = "conversations.json") -> dict[str, Any]:
 # CLI helpers (backward compat for chat_gpt_summary.py)
 # ---------------------------------------------------------------------------
 
+def _write_json_file(path: str, data: Any) -> None:
+    """Serialize *data* to an indented JSON file with a single write.
+
+    ``json.dump`` streams many small chunks to the file object; encoding
+    the whole document with ``json.dumps`` first and writing one buffer
+    produces identical output with far fewer write calls.
+
+    Args:
+        path: Destination file path.
+        data: JSON-serializable object to write.
+    """
+    with open(path, "w") as f:
+        f.write(json.dumps(data, indent=2))
+
+
+def _write_csv_file(path: str, rows: list[dict], fieldnames: list[str]) -> None:
+    """Write the *fieldnames* columns of *rows* to a CSV file.
+
+    Rows are projected to tuples and handed to ``csv.writer.writerows``,
+    skipping ``csv.DictWriter``'s per-row key validation.  Keys not
+    listed in *fieldnames* are ignored.  Unlike ``DictWriter``, missing
+    fields are not filled in: every row must contain every field.
+
+    Args:
+        path: Destination file path.
+        rows: Dicts that each contain every key in *fieldnames*.
+        fieldnames: Column names, written as the header row.
+
+    Raises:
+        KeyError: If a row is missing one of *fieldnames*.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(tuple(row[k] for k in fieldnames) for row in rows)
+
+
 def save_analytics_files(
     summaries: list[dict],
-    records: list[dict],
+    records: list[DailyRecord],
     gaps: list[dict],
     output_dir: str = "chat_analytics",
 ) -> None:
@@ -1422,44 +1575,33 @@ def save_analytics_files(
     """
     os.makedirs(output_dir, exist_ok=True)
 
-    with open(f"{output_dir}/chat_summaries.json", "w") as f:
-        json.dump(summaries, f, indent=2)
+    _write_json_file(f"{output_dir}/chat_summaries.json", summaries)
+    _write_json_file(f"{output_dir}/daily_stats.json", records)
 
-    with open(f"{output_dir}/daily_stats.json", "w") as f:
-        json.dump(records, f, indent=2)
-
-    with open(f"{output_dir}/chat_summaries.csv", "w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["date", "start_time", "end_time", "message_count", "duration_minutes"],
-        )
-        writer.writeheader()
-        writer.writerows(summaries)
-
-    with open(f"{output_dir}/daily_stats.csv", "w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "date",
-                "total_messages",
-                "total_chats",
-                "avg_messages_per_chat",
-                "max_messages_in_chat",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(records)
+    _write_csv_file(
+        f"{output_dir}/chat_summaries.csv",
+        summaries,
+        ["date", "start_time", "end_time", "message_count", "duration_minutes"],
+    )
+    _write_csv_file(
+        f"{output_dir}/daily_stats.csv",
+        records,
+        [
+            "date",
+            "total_messages",
+            "total_chats",
+            "avg_messages_per_chat",
+            "max_messages_in_chat",
+        ],
+    )
 
     if gaps:
-        with open(f"{output_dir}/message_gaps.json", "w") as f:
-            json.dump(gaps, f, indent=2)
-
-        with open(f"{output_dir}/message_gaps.csv", "w", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["start_timestamp", "end_timestamp", "length_days"]
-            )
-            writer.writeheader()
-            writer.writerows(gaps)
+        _write_json_file(f"{output_dir}/message_gaps.json", gaps)
+        _write_csv_file(
+            f"{output_dir}/message_gaps.csv",
+            gaps,
+            ["start_timestamp", "end_timestamp", "length_days"],
+        )
 
 
 def print_summary_report(
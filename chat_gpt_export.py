@@ -7,12 +7,17 @@ allowing users to select which conversations to include.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import json
 from datetime import datetime
+from functools import lru_cache
 import os
 import re
 import sys
 
+_MULTI_NL = re.compile(r'\n{3,}')
+
+
 def clean_text(text: str) -> str:
     """Remove markdown and excessive whitespace from text.
 
@@ -25,9 +30,19 @@ def clean_text(text: str) -> str:
         newlines and leading/trailing whitespace stripped.
     """
     # Simple cleanup - more sophisticated markdown parsing could be added
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Reduce multiple newlines
+    text = _MULTI_NL.sub('\n\n', text)  # Reduce multiple newlines
     return text.strip()
 
+@lru_cache(maxsize=4096)
+def _format_epoch_seconds(seconds: int) -> str:
+    """Format whole epoch seconds as local 'YYYY-MM-DD HH:MM:SS'.
+
+    Cached because messages in one conversation often share a second.
+    isoformat() renders the same layout as '%Y-%m-%d %H:%M:%S' without
+    going through strftime's format-string parser.
+    """
+    return datetime.fromtimestamp(seconds).isoformat(sep=' ', timespec='seconds')
+
 def format_timestamp(timestamp: float | int | None) -> str:
     """Convert Unix timestamp to readable date/time format.
 
@@ -43,7 +58,7 @@ def format_timestamp(timestamp: float | int | None) -> str:
         return "Unknown time"
     
     try:
-        return datetime.fromtimestamp(int(timestamp)).strftime('%Y-%m-%d %H:%M:%S')
+        return _format_epoch_seconds(int(timestamp))
     except (ValueError, TypeError, OSError):
         return "Invalid timestamp"
 
@@ -90,6 +105,9 @@ def get_message_timestamp(message_item: tuple) -> int:
         # If anything goes wrong, return 0 to allow sorting to continue
         return 0
 
+_PREVIEW_MAX_CHARS = 200
+_PREVIEW_ELLIPSIS = "..."
+
 def get_first_user_message(messages: list[dict]) -> str:
     """Find the first user message in a conversation.
 
@@ -103,11 +121,12 @@ def get_first_user_message(messages: list[dict]) -> str:
         found]' if no user messages exist.
     """
     for msg in messages:
-        if msg.get('role', '').lower() == 'user':
+        role = msg.get('role', '')
+        if role == 'user' or role.lower() == 'user':
             content = msg.get('content', '')
             # Truncate long messages for preview
-            if len(content) > 200:
-                return content[:200] + "..."
+            if len(content) > _PREVIEW_MAX_CHARS:
+                return content[:_PREVIEW_MAX_CHARS] + _PREVIEW_ELLIPSIS
             return content
     
     return "[No user message found]"
@@ -181,6 +200,9 @@ def get_valid_number_input(
         except ValueError:
             print("Please enter a valid number.")
 
+_CONVERSATION_ROLES = frozenset({'user', 'assistant'})
+
+
 def _extract_export_message(message_data: dict) -> dict | None:
     """Validate a single mapping entry and return a parsed message dict.
 
@@ -206,7 +228,8 @@ def _extract_export_message(message_data: dict) -> dict | None:
     if not isinstance(author, dict):
         return None
     role = author.get('role')
-    if role and role.lower() == 'system':
+    # Most nodes are user/assistant; only lowercase the rare other roles.
+    if role not in _CONVERSATION_ROLES and role and role.lower() == 'system':
         return None
     content_parts = message.get('content', {}).get('parts', [])
     if not content_parts:
@@ -220,16 +243,16 @@ def _extract_export_message(message_data: dict) -> dict | None:
 
 
 def _parse_mapping_messages(
-    sorted_items: list[tuple],
+    sorted_items: Iterable[tuple],
 ) -> tuple[float | int | None, list[dict]]:
     """Parse all messages from sorted mapping items.
 
-    Iterates over pre-sorted conversation mapping entries, extracts valid
-    messages, and tracks the earliest non-None timestamp as the conversation
-    creation time.
+    Iterates over pre-sorted conversation mapping entries in a single pass,
+    extracting valid messages and tracking the earliest non-None timestamp
+    as the conversation creation time.
 
     Args:
-        sorted_items: List of (message_id, message_data) tuples from a
+        sorted_items: Iterable of (message_id, message_data) tuples from a
             conversation's mapping dictionary, pre-sorted by timestamp.
 
     Returns:
@@ -268,7 +291,7 @@ def _parse_single_conversation(chat: dict) -> dict | None:
     if 'mapping' not in chat or not isinstance(chat['mapping'], dict):
         return None
 
-    mapping_items = list(chat['mapping'].items())
+    mapping_items = chat['mapping'].items()
     try:
         sorted_items = sorted(mapping_items, key=get_message_timestamp)
     except (TypeError, ValueError):
@@ -295,17 +318,27 @@ def _load_and_parse_conversations(json_file: str) -> list[dict]:
         'title', 'create_time', and 'messages' keys. Empty list on error.
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            chat_history = json.load(f)
+        # Decode straight from bytes: skips the text-mode read's separate
+        # UTF-8 decode and newline-translation pass over the whole export.
+        with open(json_file, 'rb') as f:
+            chat_history = json.loads(f.read())
     except FileNotFoundError:
         print(f"Error: File '{json_file}' not found.")
         return []
     except json.JSONDecodeError:
         print(f"Error: '{json_file}' is not a valid JSON file.")
         return []
+    if not isinstance(chat_history, list):
+        print(f"Error: '{json_file}' does not contain a list of conversations.")
+        return []
 
+    # Pop raw conversations off the end of the reversed list so each one's
+    # decoded mapping can be freed as soon as it has been parsed, instead of
+    # holding the whole raw export alongside the parsed copy.
+    chat_history.reverse()
     conversations = []
-    for chat in chat_history:
+    while chat_history:
+        chat = chat_history.pop()
         try:
             result = _parse_single_conversation(chat)
             if result is not None:
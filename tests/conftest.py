@@ -113,18 +113,20 @@ def _minimal_dashboard_payload() -> dict:
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_payload():
-    """Return the minimal dashboard payload dict."""
+    """Return the minimal dashboard payload dict (shared; do not mutate)."""
     return _minimal_dashboard_payload()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client(mock_payload):
     """TestClient for app.py with mocked analytics data.
 
-    Patches build_dashboard_payload so no conversations.json is needed.
-    Resets the module-level cache between tests.
+    Session-scoped: one TestClient and one patched cache serve every app
+    test.  Patches build_dashboard_payload so no conversations.json is
+    needed.  Tests that reset ``app._cache`` must restore its previous
+    contents when they finish.
     """
     import app as app_module
 
@@ -43,11 +43,10 @@ def make_conversations_with_days(
     """
     convos = []
     for date_str, num_chats, msgs_per_chat in day_configs:
-        base = datetime.fromisoformat(date_str + "T10:00:00")
+        base_ts = datetime.fromisoformat(date_str + "T10:00:00").timestamp()
         for c in range(num_chats):
-            msgs = []
-            for m in range(msgs_per_chat):
-                ts = base.timestamp() + c * 3600 + m * 60
-                msgs.append((ts, f"msg-{c}-{m}"))
-            convos.append(make_conversation(msgs))
+            chat_ts = base_ts + c * 3600
+            convos.append(make_conversation([
+                (chat_ts + m * 60, f"msg-{c}-{m}") for m in range(msgs_per_chat)
+            ]))
     return convos
@@ -1,17 +1,20 @@
 """Tests for analytics.py using synthetic conversation data."""
 
+import datetime as datetime_module
 import json
 from datetime import datetime
 from io import StringIO
 
 import pytest
 
+import analytics
 from analytics import (
     _build_daily_records,
     _expanding_avg,
     _extract_message_content,
     _init_daily_bucket,
     _rolling_avg,
+    _write_csv_file,
     build_dashboard_payload,
     compute_activity_by_year,
     compute_chart_data,
@@ -61,6 +64,17 @@ class TestProcessConversations:
         assert len(records) == 2
         assert len(timestamps) == 10
 
+    def test_accepts_generator(self):
+        convos = _make_conversations_with_days([("2024-01-15", 2, 3)])
+        summaries, records, timestamps = process_conversations(c for c in convos)
+        assert len(summaries) == 2
+        assert len(timestamps) == 6
+
+    def test_warns_when_no_valid_summaries(self, caplog):
+        with caplog.at_level("WARNING", logger="analytics"):
+            process_conversations(iter([{}, {}]))
+        assert "Loaded 2 conversations" in caplog.text
+
     def test_empty_mapping(self):
         convos = [{"mapping": {}}]
         summaries, records, timestamps = process_conversations(convos)
@@ -121,6 +135,15 @@ class TestProcessConversations:
         summaries, _, timestamps = process_conversations(convos)
         assert len(timestamps) == 1  # only node3 is valid
 
+    def test_non_dict_message_value_skipped(self):
+        convos = [{"mapping": {
+            "node1": {"message": "not a dict"},
+            "node2": {"message": {"author": "not a dict", "create_time": 1705300000}},
+            "node3": {"message": {"author": {"role": "user"}, "create_time": 1705300000}},
+        }}]
+        _, _, timestamps = process_conversations(convos)
+        assert len(timestamps) == 1
+
     def test_invalid_timestamp_skipped(self):
         mapping = {
             "bad": {"message": {"author": {"role": "user"}, "create_time": "not-a-number"}},
@@ -189,6 +212,17 @@ class TestComputeGapAnalysis:
         result = compute_gap_analysis(ts)
         assert result["longest_gap"]["length_days"] == pytest.approx(8.0, abs=0.01)
 
+    def test_equal_gaps_stay_chronological(self):
+        ts = [
+            datetime(2024, 1, 7, 10, 0),
+            datetime(2024, 1, 1, 10, 0),
+            datetime(2024, 1, 3, 10, 0),
+            datetime(2024, 1, 5, 10, 0),
+        ]
+        result = compute_gap_analysis(ts)
+        starts = [g["start_timestamp"] for g in result["gaps"]]
+        assert starts == ["2024-01-01T10:00:00", "2024-01-03T10:00:00", "2024-01-05T10:00:00"]
+
     def test_unsorted_input_produces_correct_gaps(self):
         ts = [
             datetime(2024, 1, 5, 10, 0),
@@ -305,6 +339,19 @@ class TestComputeSummaryStats:
         assert stats["top_days_by_chats"][0]["date"] == "2024-01-15"
         assert stats["top_days_by_messages"][0]["date"] == "2024-01-16"
 
+    def test_top_days_capped_per_year(self):
+        records = [
+            {"date": f"{yr}-01-{d:02d}", "total_messages": d, "total_chats": d, "avg_messages_per_chat": 1.0, "max_messages_in_chat": 1}
+            for yr in (2023, 2024)
+            for d in range(1, 16)
+        ]
+        stats = compute_summary_stats([], records)
+        top = stats["top_days_by_chats"]
+        assert len(top) == 20  # 10 per year
+        assert [r["total_chats"] for r in top] == sorted((r["total_chats"] for r in top), reverse=True)
+        # Ties keep input order: 2023 before 2024
+        assert [r["date"] for r in top[:2]] == ["2023-01-15", "2024-01-15"]
+
 
 # ── TestComputeChartData ────────────────────
 
@@ -383,6 +430,16 @@ class TestComputeMonthlyData:
         result = compute_monthly_data(records)
         assert result["chats_avg_3m"] == [1.0, 1.5, 2.0]
 
+    def test_unsorted_input(self):
+        records = [
+            {"date": "2024-02-05", "total_messages": 5, "total_chats": 3, "avg_messages_per_chat": 1.67, "max_messages_in_chat": 2},
+            {"date": "2024-01-20", "total_messages": 8, "total_chats": 1, "avg_messages_per_chat": 8.0, "max_messages_in_chat": 8},
+            {"date": "2024-01-15", "total_messages": 10, "total_chats": 2, "avg_messages_per_chat": 5.0, "max_messages_in_chat": 6},
+        ]
+        result = compute_monthly_data(records)
+        assert result["months"] == ["2024-01", "2024-02"]
+        assert result["messages"] == [18, 5]
+
 
 # ── TestComputeWeeklyData ─────────────────
 
@@ -405,6 +462,15 @@ class TestComputeWeeklyData:
         result = compute_weekly_data([])
         assert result["weeks"] == []
 
+    def test_unsorted_input_uses_monday(self):
+        records = [
+            {"date": "2024-01-22", "total_messages": 5, "total_chats": 3, "avg_messages_per_chat": 1.67, "max_messages_in_chat": 2},
+            {"date": "2024-01-17", "total_messages": 8, "total_chats": 1, "avg_messages_per_chat": 8.0, "max_messages_in_chat": 8},
+        ]
+        result = compute_weekly_data(records)
+        assert result["weeks"] == ["2024-01-15", "2024-01-22"]
+        assert result["messages"] == [8, 5]
+
     def test_has_rolling_averages(self):
         records = [
             {"date": f"2024-01-{d:02d}", "total_messages": d, "total_chats": 1, "avg_messages_per_chat": float(d), "max_messages_in_chat": d}
@@ -583,6 +649,9 @@ class TestComputePeriodComparison:
 # ── TestRollingAvg ──────────────────────────
 
 
+_ROLLING_VALUES = [float((i * 37) % 11) for i in range(64)]
+
+
 class TestRollingAvg:
     def test_window_3(self):
         values = [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -606,6 +675,24 @@ class TestRollingAvg:
         values = [1.0, 3.0, 5.0]
         assert _rolling_avg(values, 1) == [1.0, 3.0, 5.0]
 
+    def test_full_window_mean_is_exact(self):
+        # Differencing float prefix sums gave 2.3749999999999996 here,
+        # which rounds to 2.37 on the dashboard instead of 2.38.
+        values = [2.0, 1.0, 1.33, 2.0, 1.0, 1.0, 5.0, 2.0, 1.5, 1.0]
+        assert _rolling_avg(values, 4)[-1] == 2.375
+        assert round(_rolling_avg(values, 4)[-1], 2) == 2.38
+
+    @pytest.mark.parametrize("window", [1, 2, 3, 7, 28, 1000])
+    def test_matches_naive_window_mean(self, window):
+        expected = [
+            sum(w) / len(w)
+            for w in (
+                _ROLLING_VALUES[max(0, i - window + 1) : i + 1]
+                for i in range(len(_ROLLING_VALUES))
+            )
+        ]
+        assert _rolling_avg(_ROLLING_VALUES, window) == pytest.approx(expected)
+
 
 class TestExpandingAvg:
     def test_expanding(self):
@@ -618,6 +705,13 @@ class TestExpandingAvg:
     def test_empty(self):
         assert _expanding_avg([]) == []
 
+    def test_matches_naive_prefix_mean(self):
+        expected = [
+            sum(_ROLLING_VALUES[: i + 1]) / (i + 1)
+            for i in range(len(_ROLLING_VALUES))
+        ]
+        assert _expanding_avg(_ROLLING_VALUES) == pytest.approx(expected)
+
 
 # ── TestSaveAnalyticsFiles ──────────────────
 
@@ -645,6 +739,26 @@ class TestSaveAnalyticsFiles:
         loaded = json.loads((tmp_path / "chat_summaries.json").read_text())
         assert loaded[0]["message_count"] == 5
 
+    def test_csv_ignores_extra_summary_fields(self, tmp_path):
+        convos = _make_conversations_with_days([("2024-01-15", 1, 2)])
+        summaries, records, _ = process_conversations(convos)
+
+        save_analytics_files(summaries, records, [], str(tmp_path))
+
+        lines = (tmp_path / "chat_summaries.csv").read_text().splitlines()
+        assert lines[0] == "date,start_time,end_time,message_count,duration_minutes"
+        assert lines[1].startswith("2024-01-15,")
+        assert len(lines) == 2
+
+    def test_csv_single_field_is_one_column(self, tmp_path):
+        path = tmp_path / "dates.csv"
+        _write_csv_file(str(path), [{"date": "2024-01-15", "extra": 1}], ["date"])
+        assert path.read_text().splitlines() == ["date", "2024-01-15"]
+
+    def test_csv_missing_field_raises(self, tmp_path):
+        with pytest.raises(KeyError):
+            _write_csv_file(str(tmp_path / "x.csv"), [{"date": "2024-01-15"}], ["date", "n"])
+
     def test_no_gap_files_when_gaps_empty(self, tmp_path):
         save_analytics_files([], [], [], str(tmp_path))
         assert (tmp_path / "chat_summaries.json").exists()
@@ -694,16 +808,23 @@ class TestPrintSummaryReport:
 # ── TestBuildDashboardPayload ───────────────
 
 
-class TestBuildDashboardPayload:
-    def test_integration(self, tmp_path):
-        convos = _make_conversations_with_days([
-            ("2024-01-15", 2, 3),
-            ("2024-01-16", 1, 5),
-        ])
-        json_file = tmp_path / "conversations.json"
-        json_file.write_text(json.dumps(convos))
+_INTEGRATION_CONVOS = _make_conversations_with_days([
+    ("2024-01-15", 2, 3),
+    ("2024-01-16", 1, 5),
+])
+
+
+@pytest.fixture(scope="module")
+def integration_convos_path(tmp_path_factory):
+    """Write the integration export once per module and return its path."""
+    json_file = tmp_path_factory.mktemp("integration") / "conversations.json"
+    json_file.write_text(json.dumps(_INTEGRATION_CONVOS))
+    return str(json_file)
+
 
-        payload = build_dashboard_payload(str(json_file))
+class TestBuildDashboardPayload:
+    def test_integration(self, integration_convos_path):
+        payload = build_dashboard_payload(integration_convos_path)
 
         assert "summary" in payload
         assert "charts" in payload
@@ -744,6 +865,53 @@ class TestBuildDashboardPayload:
         assert payload["content_summary"]["avg_response_ratio"] >= 0
         assert isinstance(payload["code_stats"]["language_counts"], list)
 
+    def test_unchanged_file_reuses_sections(self, integration_convos_path):
+        first = build_dashboard_payload(integration_convos_path)
+        second = build_dashboard_payload(integration_convos_path)
+        assert second["summary"] is first["summary"]
+        assert second["charts"] is first["charts"]
+
+    def test_date_dependent_fields_follow_today(self, tmp_path, monkeypatch):
+        json_file = tmp_path / "conversations.json"
+        json_file.write_text(json.dumps(_make_conversations_with_days([("2024-01-15", 2, 2)])))
+
+        def freeze(today):
+            class _Date(datetime_module.date):
+                @classmethod
+                def today(cls):
+                    return today
+
+            class _Datetime(datetime_module.datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return datetime_module.datetime.combine(today, datetime_module.time(12))
+
+            monkeypatch.setattr(datetime_module, "date", _Date)
+            monkeypatch.setattr(analytics, "datetime", _Datetime)
+
+        freeze(datetime_module.date(2024, 1, 20))
+        january = build_dashboard_payload(str(json_file))
+        freeze(datetime_module.date(2024, 2, 10))
+        february = build_dashboard_payload(str(json_file))
+
+        assert january["summary"] is february["summary"]
+        assert january["generated_at"].startswith("2024-01-20")
+        assert february["generated_at"].startswith("2024-02-10")
+        assert january["comparison"]["this_month"]["chats"] == 2
+        assert february["comparison"]["this_month"]["chats"] == 0
+        assert february["comparison"]["last_month"]["chats"] == 2
+
+    def test_modified_file_rebuilds(self, tmp_path):
+        json_file = tmp_path / "conversations.json"
+        json_file.write_text(json.dumps(_make_conversations_with_days([("2024-01-15", 1, 2)])))
+        first = build_dashboard_payload(str(json_file))
+
+        json_file.write_text(json.dumps(_make_conversations_with_days([("2024-01-15", 2, 2)])))
+        second = build_dashboard_payload(str(json_file))
+
+        assert second is not first
+        assert second["summary"]["total_chats"] == 2
+
 
 # ── TestExtractedHelpers (from 2.8 refactor) ──
 
@@ -8,6 +8,16 @@ import pytest
 from fastapi import HTTPException
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _prime_cache(client):
+    """Populate the shared app cache once so route tests start on the cached path.
+
+    Defined here rather than in conftest.py so that only the app tests
+    import ``app``.
+    """
+    client.get("/api/data")
+
+
 # ── HTML page routes ──────────────────────────
 
 
@@ -22,21 +32,21 @@ class TestOverviewPage:
 
     def test_contains_page_title(self, client):
         response = client.get("/")
-        assert "ChatGPT Statistics" in response.text
+        assert b"ChatGPT Statistics" in response.content
 
     def test_contains_overview_title(self, client):
         response = client.get("/")
-        assert "Overview" in response.text
+        assert b"Overview" in response.content
 
     def test_contains_dashboard_data_script(self, client):
         """The template injects the payload as DASHBOARD_DATA in a script."""
         response = client.get("/")
-        assert "DASHBOARD_DATA" in response.text
+        assert b"DASHBOARD_DATA" in response.content
 
     def test_data_json_contains_summary(self, client):
         """The injected JSON should include the summary section."""
         response = client.get("/")
-        assert '"total_chats"' in response.text
+        assert b'"total_chats"' in response.content
 
 
 class TestTrendsPage:
@@ -50,11 +60,11 @@ class TestTrendsPage:
 
     def test_contains_page_title(self, client):
         response = client.get("/trends")
-        assert "Trends" in response.text
+        assert b"Trends" in response.content
 
     def test_contains_chatgpt_statistics(self, client):
         response = client.get("/trends")
-        assert "ChatGPT Statistics" in response.text
+        assert b"ChatGPT Statistics" in response.content
 
 
 class TestPatternsPage:
@@ -68,11 +78,11 @@ class TestPatternsPage:
 
     def test_contains_page_title(self, client):
         response = client.get("/patterns")
-        assert "Patterns" in response.text
+        assert b"Patterns" in response.content
 
     def test_contains_chatgpt_statistics(self, client):
         response = client.get("/patterns")
-        assert "ChatGPT Statistics" in response.text
+        assert b"ChatGPT Statistics" in response.content
 
 
 # ── JSON API routes ───────────────────────────
@@ -161,37 +171,14 @@ class TestHealthCheck:
 
 
 class TestMissingDataFile:
-    def test_overview_503_when_data_missing(self, client):
-        """When conversations.json is missing, pages should return 503."""
+    @pytest.mark.parametrize("route", ["/", "/api/data", "/trends", "/patterns"])
+    def test_503_when_data_missing(self, client, route):
+        """When conversations.json is missing, pages and the API return 503."""
         with patch(
             "app._get_cached_data",
             side_effect=HTTPException(status_code=503, detail="Data file not found"),
         ):
-            response = client.get("/")
-            assert response.status_code == 503
-
-    def test_api_data_503_when_data_missing(self, client):
-        with patch(
-            "app._get_cached_data",
-            side_effect=HTTPException(status_code=503, detail="Data file not found"),
-        ):
-            response = client.get("/api/data")
-            assert response.status_code == 503
-
-    def test_trends_503_when_data_missing(self, client):
-        with patch(
-            "app._get_cached_data",
-            side_effect=HTTPException(status_code=503, detail="Data file not found"),
-        ):
-            response = client.get("/trends")
-            assert response.status_code == 503
-
-    def test_patterns_503_when_data_missing(self, client):
-        with patch(
-            "app._get_cached_data",
-            side_effect=HTTPException(status_code=503, detail="Data file not found"),
-        ):
-            response = client.get("/patterns")
+            response = client.get(route)
             assert response.status_code == 503
 
 
@@ -212,6 +199,21 @@ class TestInvalidJsonFile:
 
 
 class TestCaching:
+    """Each test starts from an empty cache; the shared cache is restored after."""
+
+    def setup_method(self):
+        import app as app_module
+
+        self._saved_cache = dict(app_module._cache)
+        app_module._cache["data"] = None
+        app_module._cache["built_at"] = 0.0
+
+    def teardown_method(self):
+        import app as app_module
+
+        # The client fixture is session-scoped; put the shared cache back
+        app_module._cache.update(self._saved_cache)
+
     def test_second_request_uses_cache(self, client):
         """After first call populates cache, build_dashboard_payload is
         called only once for two requests."""
@@ -220,12 +222,6 @@ class TestCaching:
                 "generated_at": "2024-01-15T12:00:00",
                 "summary": {},
             }
-            # Reset cache to force a build on first call
-            import app as app_module
-
-            app_module._cache["data"] = None
-            app_module._cache["built_at"] = 0.0
-
             client.get("/api/data")
             client.get("/api/data")
             assert mock_build.call_count == 1
@@ -238,11 +234,6 @@ class TestCaching:
                 "generated_at": "2024-01-15T12:00:00",
                 "summary": {},
             }
-            import app as app_module
-
-            app_module._cache["data"] = None
-            app_module._cache["built_at"] = 0.0
-
             # First call populates cache
             client.get("/api/data")
             assert mock_build.call_count == 1
@@ -256,10 +247,7 @@ class TestCaching:
 
 
 class TestNotFound:
-    def test_unknown_route_returns_404(self, client):
-        response = client.get("/nonexistent")
-        assert response.status_code == 404
-
-    def test_unknown_api_route_returns_404(self, client):
-        response = client.get("/api/nonexistent")
+    @pytest.mark.parametrize("route", ["/nonexistent", "/api/nonexistent"])
+    def test_unknown_route_returns_404(self, client, route):
+        response = client.get(route)
         assert response.status_code == 404
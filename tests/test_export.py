@@ -147,6 +147,12 @@ class TestExtractExportMessage:
         data = _make_message_data("system", ["System prompt"])
         assert _extract_export_message(data) is None
 
+    def test_tool_role_is_kept(self):
+        data = _make_message_data("tool", ["Tool output"])
+        result = _extract_export_message(data)
+        assert result is not None
+        assert result["role"] == "tool"
+
     def test_empty_content_parts_returns_none(self):
         data = _make_message_data("user", [])
         assert _extract_export_message(data) is None
@@ -224,6 +230,14 @@ class TestLoadAndParseConversations:
         assert result == []
         assert "not a valid JSON" in capsys.readouterr().out
 
+    def test_non_list_json(self, tmp_path, capsys):
+        path = tmp_path / "object.json"
+        path.write_text(json.dumps({"title": "Not a list"}))
+
+        result = _load_and_parse_conversations(str(path))
+        assert result == []
+        assert "list of conversations" in capsys.readouterr().out
+
     def test_empty_conversations_list(self, tmp_path):
         path = tmp_path / "empty.json"
         path.write_text("[]")
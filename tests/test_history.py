@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -14,28 +16,95 @@ from chat_gpt_history import extract_user_prompts, find_earliest_conversation
 
 
 def _write_json(path: Path, data: object) -> str:
-    """Write *data* as JSON and return the string path."""
-    path.write_text(json.dumps(data), encoding="utf-8")
+    """Write *data* as JSON and return the string path.
+
+    *data* may also be an already-serialized ``bytes`` buffer, which is
+    written as-is so one encoding can be reused across tests.
+    """
+    if not isinstance(data, bytes):
+        data = json.dumps(data).encode("utf-8")
+    path.write_bytes(data)
     return str(path)
 
 
-def _make_conversation(user_texts: list[str], base_ts: float = 1_700_000_000) -> dict:
-    """Build a minimal conversation dict with user messages.
+def _make_conversation_bytes(
+    user_texts: list[str],
+    base_ts: float = 1_700_000_000,
+    title: str = "Test Chat",
+) -> bytes:
+    """Serialize a minimal conversation with user messages straight to JSON.
 
-    Each message gets a sequential timestamp starting at *base_ts*.
+    Each message gets a sequential timestamp starting at *base_ts*. The
+    JSON is produced from a template, so no intermediate dict is built;
+    only the free-text fields go through ``json.dumps`` for escaping.
+    """
+    messages = ",".join(
+        f'"msg-{i}":{{"message":{{"author":{{"role":"user"}},'
+        f'"create_time":{base_ts + i * 60},'
+        f'"content":{{"parts":[{json.dumps(text)}]}}}}}}'
+        for i, text in enumerate(user_texts)
+    )
+    return f'{{"title":{json.dumps(title)},"mapping":{{{messages}}}}}'.encode("utf-8")
+
+
+# Encoded once at import and written once per session by ``payload_dir``.
+_BASIC_CONV_BYTES = (
+    b"[" + _make_conversation_bytes(["Hello world", "Follow-up question"]) + b"]"
+)
+_EMPTY_BYTES = b"[]"
+_NULL_MESSAGE_BYTES = b'[{"mapping":{"sys":{"message":null}}}]'
+_FIRST_PROMPT_BYTES = (
+    b"["
+    + _make_conversation_bytes(["Start of prompt; rest is ignored", "No semicolon here"])
+    + b"]"
+)
+_EARLIEST_BYTES = (
+    b"["
+    + _make_conversation_bytes(["newer msg"], base_ts=1_700_100_000)
+    + b","
+    + _make_conversation_bytes(["older msg"], base_ts=1_700_000_000, title="Oldest Chat")
+    + b"]"
+)
+
+
+_PAYLOADS = {
+    "basic.json": _BASIC_CONV_BYTES,
+    "empty.json": _EMPTY_BYTES,
+    "null_message.json": _NULL_MESSAGE_BYTES,
+    "first_prompt.json": _FIRST_PROMPT_BYTES,
+    "earliest.json": _EARLIEST_BYTES,
+}
+
+
+@pytest.fixture(scope="session")
+def payload_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory holding every ``_PAYLOADS`` file, written once per session."""
+    directory = tmp_path_factory.mktemp("history")
+    for name, data in _PAYLOADS.items():
+        _write_json(directory / name, data)
+    return directory
+
+
+@pytest.fixture
+def payload_path(payload_dir: Path, tmp_path: Path) -> Callable[[str], str]:
+    """Return a function that places a named session payload in *tmp_path*.
+
+    The file is hard-linked rather than rewritten, falling back to a copy
+    where the filesystem does not support hard links.  Returned paths are
+    read-only: a hard link shares its inode with the session payload, so
+    writing through it would corrupt that payload for every later test.
+    Tests that need to modify a file must write their own under
+    *tmp_path*.
     """
-    mapping: dict[str, dict] = {}
-    for i, text in enumerate(user_texts):
-        mapping[f"msg-{i}"] = {
-            "message": {
-                "author": {"role": "user"},
-                "create_time": base_ts + i * 60,
-                "content": {"parts": [text]},
-            }
-        }
-    # Include a system node (no message) to exercise null-guard paths
-    mapping["system-node"] = {"message": None}
-    return {"title": "Test Chat", "mapping": mapping}
+    def _place(name: str) -> str:
+        src, dest = payload_dir / name, tmp_path / name
+        try:
+            dest.hardlink_to(src)
+        except OSError:
+            shutil.copy(src, dest)
+        return str(dest)
+
+    return _place
 
 
 # ── extract_user_prompts ─────────────────────────────────────────
@@ -43,42 +112,33 @@ def _make_conversation(user_texts: list[str], base_ts: float = 1_700_000_000) ->
 
 class TestExtractUserPrompts:
 
-    def test_extract_basic(self, tmp_path: Path):
-        """User messages are extracted from a single conversation."""
-        conv = _make_conversation(["Hello world", "Follow-up question"])
-        path = _write_json(tmp_path / "conv.json", [conv])
-
-        result = extract_user_prompts(path)
-
-        assert len(result) == 2
-        assert "Hello world" in result
-        assert "Follow-up question" in result
-
-    def test_extract_empty_file(self, tmp_path: Path):
-        """An empty JSON array produces an empty prompt list."""
-        path = _write_json(tmp_path / "empty.json", [])
-
-        result = extract_user_prompts(path)
-
-        assert result == []
-
-    def test_extract_first_prompt_flag(self, tmp_path: Path):
-        """only_first_prompt=True truncates messages at the first semicolon.
-
-        Messages without a semicolon are excluded entirely (the function
-        only appends when a semicolon is found in this mode).
-        """
-        conv = _make_conversation([
-            "Start of prompt; rest is ignored",
-            "No semicolon here",
-        ])
-        path = _write_json(tmp_path / "conv.json", [conv])
-
-        result = extract_user_prompts(path, only_first_prompt=True)
-
-        # Only the message with a semicolon is included
-        assert len(result) == 1
-        assert result[0] == "Start of prompt;"
+    @pytest.mark.parametrize(
+        ("payload", "kwargs", "expected"),
+        [
+            # User messages are extracted from a single conversation.
+            ("basic.json", {}, ["Hello world", "Follow-up question"]),
+            # An empty JSON array produces an empty prompt list.
+            ("empty.json", {}, []),
+            # only_first_prompt=True truncates at the first semicolon and
+            # drops messages that have none.
+            ("first_prompt.json", {"only_first_prompt": True}, ["Start of prompt;"]),
+        ],
+        ids=["basic", "empty_file", "first_prompt_flag"],
+    )
+    def test_extract(
+        self,
+        payload_path: Callable[[str], str],
+        payload: str,
+        kwargs: dict,
+        expected: list[str],
+    ):
+        result = extract_user_prompts(payload_path(payload), **kwargs)
+
+        assert sorted(result) == sorted(expected)
+
+    def test_extract_skips_null_message(self, payload_path: Callable[[str], str]):
+        """Mapping nodes whose message is null are skipped, not dereferenced."""
+        assert extract_user_prompts(payload_path("null_message.json")) == []
 
 
 # ── find_earliest_conversation ───────────────────────────────────
@@ -95,15 +155,17 @@ class TestFindEarliestConversation:
         assert conv is None
         assert ts is None
 
-    def test_find_earliest_basic(self, tmp_path: Path):
+    def test_find_earliest_basic(self, payload_path: Callable[[str], str]):
         """The conversation containing the oldest timestamp is returned."""
-        newer = _make_conversation(["newer msg"], base_ts=1_700_100_000)
-        older = _make_conversation(["older msg"], base_ts=1_700_000_000)
-        older["title"] = "Oldest Chat"
-        path = _write_json(tmp_path / "conv.json", [newer, older])
-
-        conv, ts = find_earliest_conversation(path)
+        conv, ts = find_earliest_conversation(payload_path("earliest.json"))
 
         assert conv is not None
         assert ts == 1_700_000_000
         assert conv["title"] == "Oldest Chat"
+
+    def test_find_earliest_skips_null_message(self, payload_path: Callable[[str], str]):
+        """A conversation with only null-message nodes has no timestamp."""
+        conv, ts = find_earliest_conversation(payload_path("null_message.json"))
+
+        assert conv is None
+        assert ts is None
@@ -3,60 +3,58 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import patch
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
+import chat_gpt_summary
+from chat_gpt_summary import main
 
-MODULE = "chat_gpt_summary"
 
+def _raiser(exc: BaseException) -> Callable[..., Any]:
+    """Return a function that raises *exc* whenever it is called."""
+    def _raise(*_args: Any, **_kwargs: Any) -> Any:
+        raise exc
 
-class TestMainErrorHandling:
-    """Verify main() exits with code 1 on file-related errors."""
+    return _raise
 
-    def test_missing_file_exits_1(self):
-        with patch(
-            f"{MODULE}.load_conversations",
-            side_effect=FileNotFoundError("not found"),
-        ):
-            with pytest.raises(SystemExit) as exc_info:
-                from chat_gpt_summary import main
 
-                main("nonexistent.json")
-            assert exc_info.value.code == 1
+class TestMainErrorHandling:
+    """Verify main() exits with code 1 on file-related errors."""
 
-    def test_invalid_json_exits_1(self):
+    def test_missing_file_exits_1(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            chat_gpt_summary,
+            "load_conversations",
+            _raiser(FileNotFoundError("not found")),
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            main("nonexistent.json")
+        assert exc_info.value.code == 1
+
+    def test_invalid_json_exits_1(self, monkeypatch: pytest.MonkeyPatch):
         err = json.JSONDecodeError("bad value", "", 0)
-        with patch(
-            f"{MODULE}.load_conversations",
-            side_effect=err,
-        ):
-            with pytest.raises(SystemExit) as exc_info:
-                from chat_gpt_summary import main
+        monkeypatch.setattr(chat_gpt_summary, "load_conversations", _raiser(err))
+        with pytest.raises(SystemExit) as exc_info:
+            main("corrupt.json")
+        assert exc_info.value.code == 1
+
 
-                main("corrupt.json")
-            assert exc_info.value.code == 1
+@pytest.fixture
+def stub_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace every analytics step main() calls with a cheap stub."""
+    monkeypatch.setattr(chat_gpt_summary, "load_conversations", lambda *_: [])
+    monkeypatch.setattr(chat_gpt_summary, "process_conversations", lambda *_: ([], [], []))
+    monkeypatch.setattr(chat_gpt_summary, "compute_gap_analysis", lambda *_: {"gaps": []})
+    monkeypatch.setattr(chat_gpt_summary, "compute_summary_stats", lambda *_: {})
+    monkeypatch.setattr(chat_gpt_summary, "save_analytics_files", lambda *a, **k: None)
+    monkeypatch.setattr(chat_gpt_summary, "print_summary_report", lambda *a, **k: None)
 
 
 class TestMainSuccessfulRun:
     """Verify main() completes without error when all analytics succeed."""
 
-    def test_successful_run(self):
-        with (
-            patch(f"{MODULE}.load_conversations", return_value=[]),
-            patch(
-                f"{MODULE}.process_conversations",
-                return_value=([], [], []),
-            ),
-            patch(
-                f"{MODULE}.compute_gap_analysis",
-                return_value={"gaps": []},
-            ),
-            patch(f"{MODULE}.compute_summary_stats", return_value={}),
-            patch(f"{MODULE}.save_analytics_files"),
-            patch(f"{MODULE}.print_summary_report"),
-        ):
-            from chat_gpt_summary import main
-
-            # Should complete without raising SystemExit or any exception
-            main("conversations.json")
+    def test_successful_run(self, stub_pipeline: None):
+        # Should complete without raising SystemExit or any exception
+        main("conversations.json")